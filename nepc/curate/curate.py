@@ -32,6 +32,17 @@ class CurateCS(ABC):
                     print(f"removing zero_indices: {np.setdiff1d(np.arange(len(cs['data']['e'])), nonzero_indices)}")
                 cs['data']['e'] = cs['data']['e'][nonzero_indices]
                 cs['data']['sigma'] = cs['data']['sigma'][nonzero_indices]
+            elif isinstance(cs['data'], np.ndarray) and cs['data'].dtype.kind == 'f':
+                nonzero_indices = np.flatnonzero(cs['data'][:, 1] != 0.0)
+                if nonzero_indices.size == 0:
+                    continue
+                # drop trailing zeros and all but the last leading zero
+                start = max(nonzero_indices[0] - 1, 0)
+                end = nonzero_indices[-1] + 1
+                if debug:
+                    print('removing {} and {} from csdata[\'data\']'.format(cs['data'][:start],
+                                                                        cs['data'][end:]))
+                cs['data'] = cs['data'][start:end]
             else:
                 i = len(cs['data']) - 1
                 while cs['data'][i][1] == 0.0:
@@ -539,7 +550,11 @@ class CurateLumped(CurateCS):
         logz = np.log10(zz)
         logx = np.log10(xx)
         logy = np.log10(yy)
-        return np.power(10.0, np.interp(logz, logx, logy, right=-1000.0))
+        log_sigma = np.interp(logz, logx, logy, right=-1000.0)
+        if np.ndim(log_sigma) == 0:
+            return np.power(10.0, log_sigma)
+        # exponentiate in place rather than allocating another grid-sized array
+        return np.power(10.0, log_sigma, out=log_sigma)
 
     def lump(self, csdata):
         min_e = np.Inf
@@ -559,21 +574,19 @@ class CurateLumped(CurateCS):
 
         e_range = np.logspace(e_range_low, e_range_high, (e_range_high - e_range_low) * 100 + 1)
 
-        sigma = [0.0 for _ in range(len(e_range))]
-        for e, i in zip(e_range, range(len(e_range))):    
-            for cs in csdata:
-                sigma_i = self.log_interp(e, cs.data['e'], cs.data['sigma'])
-                if ~np.isnan(sigma_i):
-                    sigma[i] += sigma_i
+        sigma = np.zeros_like(e_range)
+        for cs in csdata:
+            sigma_cs = self.log_interp(e_range, cs.data['e'], cs.data['sigma'])
+            sigma_cs[np.isnan(sigma_cs)] = 0.0
+            sigma += sigma_cs
         sigma_nan = np.isnan(sigma)
-        sigma = np.array(sigma)
         e_range = e_range[~sigma_nan]
         sigma = sigma[~sigma_nan]
         eps = 1.0E-24
         sigma[np.abs(sigma) < eps] = 0.0
         csdata_lumped = {}
         csdata_lumped['threshold'] = threshold
-        csdata_lumped['data'] = np.asarray([[e_i, sigma_i] for e_i, sigma_i in zip(e_range, sigma)])
+        csdata_lumped['data'] = np.column_stack((e_range, sigma))
         return csdata_lumped
 
 
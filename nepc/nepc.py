@@ -37,11 +37,17 @@ are in ``tests/data/methods``.
 
 """
 from typing import List
+from itertools import cycle, islice
+from functools import lru_cache
+import operator
 import numpy as np
 from pandas import DataFrame
 import pandas as pd
 import mysql.connector
 import matplotlib.pyplot as plt
+from matplotlib import cbook
+from matplotlib.collections import PolyCollection
+from matplotlib.lines import Line2D
 from nepc.util import config
 
 
@@ -273,6 +279,184 @@ def cs_metadata(cursor, cs_id):
     return list(cursor.fetchall()[0])
 
 
+@lru_cache(maxsize=None)
+def _sigma_label(units_sigma):
+    """Return the y-axis label for cross sections in units of ``units_sigma`` :math:`m^2`.
+
+    """
+    return r'Cross Section (' + "{0:.0e}".format(units_sigma) + " m$^2$)"
+
+
+def _decimate(e_energy, sigma, max_points):
+    """Reduce cross section data to ``max_points`` points for plotting.
+
+    Points are sampled at log-spaced indices, so the low-energy region (e.g.
+    thresholds and peaks) keeps full resolution; where log-spacing would repeat
+    an index, consecutive indices are used instead so exactly ``max_points``
+    points are returned. The first and last points are always kept.
+
+    Parameters
+    ----------
+    e_energy : :class:`numpy.ndarray`
+        Electron energies.
+    sigma : :class:`numpy.ndarray`
+        Cross sections.
+    max_points : int or None
+        Maximum number of points to keep (at least 2). If None, the data is not
+        reduced.
+
+    Returns
+    -------
+    : :class:`numpy.ndarray`
+        Electron energies.
+    : :class:`numpy.ndarray`
+        Cross sections.
+
+    Raises
+    ------
+    TypeError
+        If ``max_points`` is not an integer.
+    ValueError
+        If ``max_points`` is less than 2.
+
+    """
+    if max_points is None:
+        return e_energy, sigma
+    max_points = operator.index(max_points)
+    if max_points < 2:
+        raise ValueError(f'max_points must be at least 2, not {max_points}')
+    if e_energy.size <= max_points:
+        return e_energy, sigma
+    offsets = np.arange(max_points)
+    indices = np.geomspace(1, e_energy.size, max_points).astype(int) - 1
+    # make the indices strictly increasing; this stays within [0, size - 1]
+    # since log-spaced indices lie below the line from 0 to size - 1
+    indices = np.maximum.accumulate(indices - offsets) + offsets
+    return e_energy[indices], sigma[indices]
+
+
+def _band_vertices(e_energy, sigma, lpu, upu):
+    """Return the polygon for the uncertainty band of a cross section.
+
+    Parameters
+    ----------
+    e_energy : :class:`numpy.ndarray`
+        Electron energies.
+    sigma : :class:`numpy.ndarray`
+        Cross sections.
+    lpu : float
+        Lower percent uncertainty, or -1 if not known.
+    upu : float
+        Upper percent uncertainty, or -1 if not known.
+
+    Returns
+    -------
+    : :class:`numpy.ndarray` or None
+        A ``(2n, 2)`` array with the lower bound in order of increasing index
+        followed by the upper bound in reverse, or None if neither ``lpu`` nor
+        ``upu`` is known. A missing bound is drawn at ``sigma``.
+
+    """
+    if lpu == -1 and upu == -1:
+        return None
+    lower_factor = 1 - lpu if lpu != -1 else 1
+    upper_factor = 1 + upu if upu != -1 else 1
+
+    # write the bounds directly into the polygon rather than into temporaries
+    n_points = e_energy.size
+    verts = np.empty((2*n_points, 2))
+    verts[:n_points, 0] = e_energy
+    verts[n_points:, 0] = e_energy[::-1]
+    np.multiply(sigma, lower_factor, out=verts[:n_points, 1])
+    np.multiply(sigma[::-1], upper_factor, out=verts[n_points:, 1])
+    return verts
+
+
+def _plot_cs_list(cs_list, *, units_sigma, plot_param_dict, xlim_param_dict,
+                  ylim_param_dict, ylog, xlog, show_legend, filename,
+                  width, height, rasterized, max_points):
+    """Plot cross sections and their uncertainty bands on a new figure.
+
+    Shared by :meth:`.CS.plot` and :meth:`.Model.plot`; see those methods for
+    the parameters.
+
+    Parameters
+    ----------
+    cs_list : iterable of :class:`.CS` or :class:`.CustomCS`
+        The cross sections to plot.
+
+    Returns
+    -------
+    :class:`matplotlib.axes.Axes`
+        Plot of the cross section data.
+
+    """
+    _, axes = plt.subplots(figsize=(width, height))
+
+    if ylog:
+        plt.yscale('log')
+
+    if xlog:
+        plt.xscale('log')
+
+    plt.ylabel(_sigma_label(units_sigma))
+    plt.xlabel(r'Electron Energy (eV)')
+
+    axes.set_xlim(**xlim_param_dict)
+    axes.set_ylim(**ylim_param_dict)
+
+    axes.tick_params(direction='in', which='both',
+                     bottom=True, top=True, left=True, right=True)
+
+    # pick curve colors up front so the band colors are known without
+    # querying each Line2D; a color in plot_param_dict takes precedence
+    plot_param_dict = cbook.normalize_kwargs(plot_param_dict, Line2D)
+    colors = cycle(plt.rcParams['axes.prop_cycle'].by_key().get('color', ['C0']))
+
+    fill_verts = []
+    fill_colors = []
+    for cs in cs_list:
+        reaction = reaction_latex(cs)
+        label_text = (f"{cs.metadata['process']}: {reaction}"
+                      if cs.metadata['process'] else reaction)
+        e_np, sigma_np = _decimate(np.asarray(cs.data['e'], dtype=np.float64),
+                                   np.asarray(cs.data['sigma'], dtype=np.float64),
+                                   max_points)
+
+        sigma_np = sigma_np*(cs.metadata['units_sigma']/units_sigma)
+
+        plot_color_dict = {'color': next(colors), **plot_param_dict}
+        axes.plot(e_np,
+                  sigma_np,
+                  **plot_color_dict,
+                  rasterized=rasterized,
+                  label=label_text)
+
+        verts = _band_vertices(e_np, sigma_np,
+                               cs.metadata['lpu'], cs.metadata['upu'])
+        if verts is not None:
+            fill_verts.append(verts)
+            fill_colors.append(plot_color_dict['color'])
+
+    # draw all uncertainty bands as one artist rather than one per cross section
+    if fill_verts:
+        axes.add_collection(PolyCollection(fill_verts, facecolors=fill_colors,
+                                           edgecolors=fill_colors, alpha=0.4,
+                                           rasterized=rasterized))
+        axes.autoscale_view()
+
+    if show_legend:
+        axes.legend(fontsize=12, ncol=2, frameon=False,
+                    bbox_to_anchor=(1.0, 1.0))
+        # ax.legend(box='best',
+        #           bbox_to_anchor=(0.5, 0.75), ncol=1, loc='center left')
+
+    if filename is not None:
+        plt.savefig(filename)
+
+    return axes
+
+
 class CS:
     r"""A cross section data set, including metadata and cross section data,
     from a NEPC MySQL database.
@@ -402,7 +586,7 @@ class CS:
     def plot(self, units_sigma=1E-20, plot_param_dict={'linewidth': 1},
              xlim_param_dict={'auto': True}, ylim_param_dict={'auto': True},
              ylog=False, xlog=False, show_legend=True, filename=None,
-             width=10, height=10):
+             width=10, height=10, rasterized=False, max_points=None):
         r"""Plot a single cross section data set.
 
         Parameters
@@ -427,6 +611,13 @@ class CS:
             width of plot
         height: float, optional
             height of plot
+        rasterized: bool, optional
+            whether to rasterize the cross section curve and uncertainty band
+            in vector output (e.g. pdf, svg), which keeps files with dense data
+            small and fast to render (default is False)
+        max_points: int, optional
+            if provided, plot at most this many log-spaced points of the cross
+            section data (default is to plot all points)
 
         Returns
         -------
@@ -435,62 +626,13 @@ class CS:
             using information in the metadata, :attr:`.CS.metadata`.
 
         """
-        _, axes = plt.subplots()
-
-        if ylog:
-            plt.yscale('log')
-
-        if xlog:
-            plt.xscale('log')
-
-        plt.rcParams["figure.figsize"] = (width, height)
-        units_sigma_tex = "{0:.0e}".format(units_sigma) + " m$^2$"
-        plt.ylabel(r'Cross Section (' + units_sigma_tex + ')')
-        plt.xlabel(r'Electron Energy (eV)')
-
-        axes.set_xlim(**xlim_param_dict)
-        axes.set_ylim(**ylim_param_dict)
-
-        axes.tick_params(direction='in', which='both',
-                         bottom=True, top=True, left=True, right=True)
-
-        reaction = reaction_latex(self)
-        label_items = [self.metadata['process'], ": ", reaction]
-        label_text = " ".join(item for item in label_items if item)
-        e_np = np.array(self.data['e'])
-        sigma_np = np.array(self.data['sigma'])
-
-        upu = self.metadata['upu']
-        lpu = self.metadata['lpu']
-        if upu != -1:
-            sigma_upper_np = sigma_np*(1 + upu)
-            if lpu == -1:
-                sigma_lower_np = sigma_np
-        if lpu != -1:
-            sigma_lower_np = sigma_np*(1 - lpu)
-            if upu == -1:
-                sigma_upper_np = sigma_np
-
-        plot = axes.plot(e_np,
-                         sigma_np*self.metadata['units_sigma']/units_sigma,
-                         **plot_param_dict,
-                         label='{}'.format(label_text))
-
-        if upu != -1 or lpu != -1:
-            fill_color = plot[0].get_color()
-            axes.fill_between(e_np, sigma_lower_np, sigma_upper_np,
-                              color=fill_color, alpha=0.4)
-
-        if show_legend:
-            axes.legend(fontsize=12, ncol=2, frameon=False,
-                        bbox_to_anchor=(1.0, 1.0))
-            # ax.legend(box='best',
-            #           bbox_to_anchor=(0.5, 0.75), ncol=1, loc='center left')
-
-        if filename is not None:
-            plt.savefig(filename)
-
-        return axes
+        return _plot_cs_list([self], units_sigma=units_sigma,
+                             plot_param_dict=plot_param_dict,
+                             xlim_param_dict=xlim_param_dict,
+                             ylim_param_dict=ylim_param_dict,
+                             ylog=ylog, xlog=xlog, show_legend=show_legend,
+                             filename=filename, width=width, height=height,
+                             rasterized=rasterized, max_points=max_points)
 
 
 class CustomCS(CS):
@@ -660,10 +802,11 @@ class Model:
 
 
         for cs in cs_subset:
-            csdata = np.array(list(zip(cs.data['e'], cs.data['sigma'])))
-            e_peak = csdata[np.argmax(csdata[:, 1]), 0]
-            cs_peak_sigma = np.max(csdata[:, 1])
-            e_upper = np.max(csdata[csdata[:, 1] != 0.0][:, 0])
+            e_np = np.asarray(cs.data['e'], dtype=np.float64)
+            sigma_np = np.asarray(cs.data['sigma'], dtype=np.float64)
+            e_peak = e_np[np.argmax(sigma_np)]
+            cs_peak_sigma = np.max(sigma_np)
+            e_upper = np.max(e_np[sigma_np != 0.0])
             if e_peak > max_e_peak:
                 max_e_peak = e_peak
             if e_peak < min_e_peak:
@@ -710,12 +853,8 @@ class Model:
         """sets :attr:`.Model.unique`
 
         """
-        for cs, i in zip(self.cs, range(len(self.cs))):
-            if i == 0:
-                _unique = np.asarray(cs.data['e'])
-            else:
-                _unique = np.unique(np.concatenate([_unique, np.asarray(cs.data['e'])]))
-        self.unique = list(_unique)
+        self.unique = list(np.unique(np.concatenate(
+            [np.asarray(cs.data['e'], dtype=np.float64) for cs in self.cs])))
 
 
     def plot(self,
@@ -726,7 +865,8 @@ class Model:
              ylim_param_dict={'auto': True},
              ylog=False, xlog=False, show_legend=True,
              filename=None,
-             max_plots=10, width=10, height=10):
+             max_plots=10, width=10, height=10, rasterized=False,
+             max_points=None):
         """Plot cross section data in the Model.
 
         Parameters
@@ -747,6 +887,12 @@ class Model:
             filename for output, if provided (default is to not output a file)
         max_cs : int
             maximum number of CS to put on graph
+        rasterized: bool
+            whether to rasterize the cross section curves and uncertainty bands
+            in vector output (default is False)
+        max_points: int
+            if provided, plot at most this many log-spaced points of each cross
+            section (default is to plot all points)
 
         Returns
         -------
@@ -756,69 +902,17 @@ class Model:
             model.
 
         """
-        _, axes = plt.subplots()
-
-        if ylog:
-            plt.yscale('log')
-
-        if xlog:
-            plt.xscale('log')
-
-        plt.rcParams["figure.figsize"] = (width, height)
-        units_sigma_tex = "{0:.0e}".format(units_sigma) + " m$^2$"
-        plt.ylabel(r'Cross Section (' + units_sigma_tex + ')')
-        plt.xlabel(r'Electron Energy (eV)')
-
-        axes.set_xlim(**xlim_param_dict)
-        axes.set_ylim(**ylim_param_dict)
-
-        axes.tick_params(direction='in', which='both',
-                         bottom=True, top=True, left=True, right=True)
-
-        plot_num = 0
-        for i in range(len(self.cs)):
-            if plot_num >= max_plots:
-                continue
-            elif process in ('', self.cs[i].metadata['process']):
-                plot_num += 1
-
-                reaction = reaction_latex(self.cs[i])
-                label_items = [self.cs[i].metadata['process'], ": ", reaction]
-                label_text = " ".join(item for item in label_items if item)
-                e_np = np.array(self.cs[i].data['e'])
-                sigma_np = np.array(self.cs[i].data['sigma'])
-
-                upu = self.cs[i].metadata['upu']
-                lpu = self.cs[i].metadata['lpu']
-                if upu != -1:
-                    sigma_upper_np = sigma_np*(1 + upu)
-                    if lpu == -1:
-                        sigma_lower_np = sigma_np
-                if lpu != -1:
-                    sigma_lower_np = sigma_np*(1 - lpu)
-                    if upu == -1:
-                        sigma_upper_np = sigma_np
-
-                plot = axes.plot(e_np,
-                                 sigma_np*self.cs[i].metadata['units_sigma']/units_sigma,
-                                 **plot_param_dict,
-                                 label='{}'.format(label_text))
-
-                if upu != -1 or lpu != -1:
-                    fill_color = plot[0].get_color()
-                    axes.fill_between(e_np, sigma_lower_np, sigma_upper_np,
-                                      color=fill_color, alpha=0.4)
-
-        if show_legend:
-            axes.legend(fontsize=12, ncol=2, frameon=False,
-                        bbox_to_anchor=(1.0, 1.0))
-            # ax.legend(box='best',
-            #           bbox_to_anchor=(0.5, 0.75), ncol=1, loc='center left')
-
-        if filename is not None:
-            plt.savefig(filename)
-
-        return axes
+        # stop scanning the model once max_plots matching cross sections are found
+        cs_to_plot = islice((cs for cs in self.cs
+                             if process in ('', cs.metadata['process'])),
+                            max_plots)
+        return _plot_cs_list(cs_to_plot, units_sigma=units_sigma,
+                             plot_param_dict=plot_param_dict,
+                             xlim_param_dict=xlim_param_dict,
+                             ylim_param_dict=ylim_param_dict,
+                             ylog=ylog, xlog=xlog, show_legend=show_legend,
+                             filename=filename, width=width, height=height,
+                             rasterized=rasterized, max_points=max_points)
 
 
 class CustomModel(Model):
@@ -930,6 +1024,52 @@ def process_attr(process: str, attr_list: List[str], test=False):
     return process_attr_dict
                                          
 
+@lru_cache(maxsize=None, typed=True)
+def _reaction_latex_side(process, e_on_side, sideA_long, sideB_long, side_v, e_first):
+    """Return the LaTeX for one side of the process involved in a nepc cross section.
+
+    Cached on the metadata values that determine the text, so plotting or
+    summarizing a model repeatedly reuses the formatted reaction. The cache is
+    typed because ``2`` and ``2.0`` compare equal but are written differently.
+
+    Parameters
+    ----------
+    process : str
+        ``process`` from :attr:`.CS.metadata`.
+    e_on_side : int
+        Number of electrons on this side of the process.
+    sideA_long : str
+        ``long_name`` of the A state on this side.
+    sideB_long : str
+        ``long_name`` of the B state on this side.
+    side_v : int
+        Vibrational energy level of the A state on this side.
+    e_first : bool
+        Whether the electrons are written before (LHS) or after (RHS) the states.
+
+    Returns
+    -------
+    : str
+        The LaTeX for one side of the process.
+
+    """
+    if e_on_side == 0:
+        side_e_text = None
+    elif e_on_side == 1:
+        side_e_text = "e$^-$"
+    else:
+        side_e_text = str(e_on_side) + "e$^-$"
+
+    sideA_text = sideA_long
+    if process == 'excitation_v':
+        sideA_text = sideA_text.replace(")", " v=" + str(side_v) + ")")
+    if e_first:
+        side_items = [side_e_text, sideA_text, sideB_long]
+    else:
+        side_items = [sideA_text, sideB_long, side_e_text]
+    return " + ".join(item for item in side_items if item)
+
+
 def reaction_latex_lhs(cs):
     """Return the LaTeX for the LHS of the process involved in a nepc cross section.
 
@@ -947,24 +1087,9 @@ def reaction_latex_lhs(cs):
     # FIXME: move this method to the CS Class
     # FIXME: allow for varying electrons and including hv, v, j on rhs and lhs
     # FIXME: decide how to represent total cross sections and implement
-    e_on_lhs = cs.metadata['e_on_lhs']
-    if e_on_lhs == 0:
-        lhs_e_text = None
-    elif e_on_lhs == 1:
-        lhs_e_text = "e$^-$"
-    else:
-        lhs_e_text = str(e_on_lhs) + "e$^-$"
-
-    lhsA_text = cs.metadata['lhsA_long']
-    if cs.metadata['process'] == 'excitation_v':
-        lhsA_text = lhsA_text.replace(")", " v=" + str(cs.metadata['lhs_v']) + ")")
-    lhsB_text = cs.metadata['lhsB_long']
-    lhs_items = [lhs_e_text,
-                 lhsA_text,
-                 lhsB_text]
-    lhs_text = " + ".join(item for item in lhs_items if item)
-
-    return lhs_text
+    return _reaction_latex_side(cs.metadata['process'], cs.metadata['e_on_lhs'],
+                                cs.metadata['lhsA_long'], cs.metadata['lhsB_long'],
+                                cs.metadata['lhs_v'], e_first=True)
 
 
 def reaction_latex_rhs(cs):
@@ -984,24 +1109,9 @@ def reaction_latex_rhs(cs):
     # FIXME: move this method to the CS Class
     # FIXME: allow for varying electrons and including hv, v, j on rhs and lhs
     # FIXME: decide how to represent total cross sections and implement
-    e_on_rhs = cs.metadata['e_on_rhs']
-    if e_on_rhs == 0:
-        rhs_e_text = None
-    elif e_on_rhs == 1:
-        rhs_e_text = "e$^-$"
-    else:
-        rhs_e_text = str(e_on_rhs) + "e$^-$"
-
-    rhsA_text = cs.metadata['rhsA_long']
-    if cs.metadata['process'] == 'excitation_v':
-        rhsA_text = rhsA_text.replace(")", " v=" + str(cs.metadata['rhs_v']) + ")")
-    rhsB_text = cs.metadata['rhsB_long']
-    rhs_items = [rhsA_text,
-                 rhsB_text,
-                 rhs_e_text]
-    rhs_text = " + ".join(item for item in rhs_items if item)
-
-    return rhs_text
+    return _reaction_latex_side(cs.metadata['process'], cs.metadata['e_on_rhs'],
+                                cs.metadata['rhsA_long'], cs.metadata['rhsB_long'],
+                                cs.metadata['rhs_v'], e_first=False)
 
 
 def reaction_latex(cs):
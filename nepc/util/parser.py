@@ -35,6 +35,8 @@ def parse(filename, has_arg=True, debug=False):
     -------
     processes : list of dict
         A list with all processes, in dictionary form, included in the file.
+        The ``data`` of each process is a :class:`numpy.ndarray` of shape
+        ``(n, 2)`` holding electron energies and cross sections as float64.
 
     Notes
     -----
@@ -121,7 +123,7 @@ def _read_block(fp, has_arg=True, debug=False):
 
     if debug:
         print('Read process {}'.format(target))
-    data = np.loadtxt(_read_until_sep(fp, debug=debug)).tolist()
+    data = np.loadtxt(_read_until_sep(fp, debug=debug), dtype=np.float64, ndmin=2)
 
     return target, arg, header, data
 
@@ -526,12 +528,11 @@ def text_array_to_float_array(text_array, omit_regexp=''):
     data : float array
     An array of floats containing float-converted data
     from text_array"""
-    data = np.empty(shape=(0, 1))
-    for inde in range(0, len(text_array)):
-        if (omit_regexp == '' or not(
-                bool(re.search(omit_regexp, text_array[inde])))):
-            data = np.append(data, [[float(text_array[inde])]], axis=0)
-    return data
+    # convert in one pass rather than np.append'ing (and copying) per element
+    data = np.asarray([float(text) for text in text_array
+                       if omit_regexp == '' or not re.search(omit_regexp, text)],
+                      dtype=np.float64)
+    return data.reshape(-1, 1)
 
 
 def format_model(model, type='lxcat', filename='lxcat.txt'):
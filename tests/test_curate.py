@@ -0,0 +1,29 @@
+"""Tests for nepc.curate.curate.py"""
+import numpy as np
+from nepc.curate.curate import CurateLxCAT
+
+
+def test_remove_zeros_ndarray_matches_list():
+    """Verify CurateCS.remove_zeros trims float ndarray data the same way as
+    list data: trailing zeros and all but the last leading zero are removed"""
+    rows = [[1.0, 0.0], [2.0, 0.0], [3.0, 0.0], [4.0, 1.0],
+            [5.0, 0.0], [6.0, 2.0], [7.0, 0.0], [8.0, 0.0]]
+    csdata_list = [{'data': [row.copy() for row in rows]}]
+    csdata_np = [{'data': np.asarray(rows)},
+                 {'data': np.asarray([[1.0, 1.0], [2.0, 2.0]])}]
+    CurateLxCAT().remove_zeros(csdata_list)
+    CurateLxCAT().remove_zeros(csdata_np)
+    assert csdata_list[0]['data'] == [[3.0, 0.0], [4.0, 1.0], [5.0, 0.0], [6.0, 2.0]]
+    np.testing.assert_array_equal(csdata_np[0]['data'], csdata_list[0]['data'])
+    np.testing.assert_array_equal(csdata_np[1]['data'], [[1.0, 1.0], [2.0, 2.0]])
+
+
+def test_remove_zeros_ndarray_all_zero():
+    """Verify CurateCS.remove_zeros leaves float ndarray data with no nonzero
+    cross sections unchanged"""
+    data = np.asarray([[1.0, 0.0], [2.0, 0.0], [3.0, 0.0]])
+    csdata = [{'data': data}]
+    CurateLxCAT().remove_zeros(csdata)
+    assert csdata[0]['data'] is data
+    np.testing.assert_array_equal(csdata[0]['data'],
+                                  [[1.0, 0.0], [2.0, 0.0], [3.0, 0.0]])
@@ -1,4 +1,6 @@
 """Tests for nepc/nepc.py"""
+import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 import pytest
 import mysql.connector
@@ -271,3 +273,91 @@ def test_model_subset(nepc_connect):
     with pytest.raises(Exception):
         assert fict.subset()
 
+
+
+def test_decimate():
+    """Verify nepc.nepc._decimate returns exactly max_points strictly increasing
+    samples including the first and last points, and rejects max_points < 2
+    and non-integer max_points"""
+    e_energy = np.arange(10000, dtype=np.float64)
+    sigma = 2.0*e_energy
+    for max_points in (2, 3, 100, 9999):
+        e_dec, sigma_dec = nepc.nepc._decimate(e_energy, sigma, max_points)
+        assert e_dec.size == max_points
+        assert e_dec[0] == e_energy[0]
+        assert e_dec[-1] == e_energy[-1]
+        assert np.all(np.diff(e_dec) > 0)
+        np.testing.assert_array_equal(sigma_dec, 2.0*e_dec)
+    for max_points in (None, 10000, 20000):
+        e_dec, sigma_dec = nepc.nepc._decimate(e_energy, sigma, max_points)
+        assert e_dec is e_energy
+        assert sigma_dec is sigma
+    for max_points in (-1, 0, 1):
+        with pytest.raises(ValueError):
+            nepc.nepc._decimate(e_energy, sigma, max_points)
+    for max_points in (500.0, '500'):
+        with pytest.raises(TypeError):
+            nepc.nepc._decimate(e_energy, sigma, max_points)
+    e_dec, _ = nepc.nepc._decimate(e_energy, sigma, np.int64(100))
+    assert e_dec.size == 100
+
+
+def _custom_cs(process, lpu=0.1, upu=0.1, units_sigma=1E-21):
+    """Build a DB-free CustomCS for e + N2(X) -> N2(A) + e"""
+    metadata = {'specie': 'N2', 'process': process,
+                'units_e': 1.0, 'units_sigma': units_sigma, 'threshold': 1.0,
+                'lhsA_long': 'N$_2$(X)', 'lhsB_long': None,
+                'rhsA_long': 'N$_2$(A)', 'rhsB_long': None,
+                'lhs_v': -1, 'rhs_v': -1, 'e_on_lhs': 1, 'e_on_rhs': 1,
+                'lpu': lpu, 'upu': upu}
+    data = {'e': [1.0, 2.0, 3.0], 'sigma': [1.0, 2.0, 3.0]}
+    return nepc.CustomCS(metadata=metadata, data=data)
+
+
+def test_plot_band_brackets_line():
+    """Verify CS.plot and Model.plot draw the uncertainty band around the
+    plotted curve when the data are not in the plotted units_sigma"""
+    cs = _custom_cs('excitation')
+    model = nepc.CustomModel(cs_list=[cs, _custom_cs('ionization')])
+    for axes in (cs.plot(units_sigma=1E-20),
+                 model.plot(units_sigma=1E-20)):
+        sigma_plot = np.array([0.1, 0.2, 0.3])
+        paths = axes.collections[0].get_paths()
+        assert len(paths) == len(axes.lines)
+        for line, path in zip(axes.lines, paths):
+            np.testing.assert_allclose(line.get_ydata(), sigma_plot)
+            y_band = path.vertices[:, 1]
+            np.testing.assert_allclose([y_band.min(), y_band.max()],
+                                       [0.09, 0.33])
+            assert y_band.min() <= np.min(line.get_ydata())
+            assert y_band.max() >= np.max(line.get_ydata())
+        plt.close(axes.figure)
+
+
+def test_plot_label():
+    """Verify the legend label of a plotted cross section is the process
+    followed by the reaction, or just the reaction if there is no process"""
+    reaction = 'e$^-$ + N$_2$(X) $\\rightarrow$ N$_2$(A) + e$^-$'
+    model = nepc.CustomModel(cs_list=[_custom_cs('excitation'),
+                                      _custom_cs('')])
+    axes = model.plot()
+    assert axes.lines[0].get_label() == 'excitation: ' + reaction
+    assert axes.lines[1].get_label() == reaction
+    plt.close(axes.figure)
+
+
+def test_reaction_latex_mixed_numeric_types():
+    """Verify nepc.reaction_latex writes int and float v and e_on_* values
+    as given, regardless of which was formatted first"""
+    cs_float = _custom_cs('excitation_v')
+    cs_int = _custom_cs('excitation_v')
+    for key, float_value, int_value in (('lhs_v', 2.0, 2), ('rhs_v', 2.0, 2),
+                                        ('e_on_rhs', 2.0, 2)):
+        cs_float.metadata[key] = float_value
+        cs_int.metadata[key] = int_value
+    float_text = ('e$^-$ + N$_2$(X v=2.0) $\\rightarrow$ '
+                  'N$_2$(A v=2.0) + 2.0e$^-$')
+    int_text = 'e$^-$ + N$_2$(X v=2) $\\rightarrow$ N$_2$(A v=2) + 2e$^-$'
+    assert nepc.reaction_latex(cs_float) == float_text
+    assert nepc.reaction_latex(cs_int) == int_text
+    assert nepc.reaction_latex(cs_float) == float_text
@@ -1,4 +1,5 @@
 """Tests for nepc.util.parser.py"""
+import numpy as np
 import pytest
 from nepc.util import parser
 import nepc
@@ -35,3 +36,59 @@ def test_format_model_write_file(nepc_connect, tmpdir):
         fb = f.read()
         readable_hash = hashlib.md5(fb).hexdigest()
     assert readable_hash == '8f8c7935e3d80ea20ca9fffd98391ade'
+
+
+BOLSIG_BLOCK = """EXCITATION
+N2 -> N2(A3)
+ 6.17
+SPECIES: e / N2
+PROCESS: E + N2 -> E + N2(A3), Excitation
+COMMENT: fictitious data
+-----------------------------
+ 6.17\t0.0
+ 7.00\t1.0e-22
+ 8.00\t2.0e-22
+-----------------------------
+"""
+
+
+def test_read_block_returns_float_array(tmpdir):
+    """Verify _read_block returns the data block as an (n, 2) float64 array,
+    including for a single-row block"""
+    file = tmpdir.join('block.txt')
+    file.write(BOLSIG_BLOCK.split('\n', 1)[1])
+    with open(str(file)) as fp:
+        target, arg, header, data = parser._read_block(fp)
+    assert target == 'N2 -> N2(A3)'
+    assert arg == '6.17'
+    assert header.splitlines()[0] == 'SPECIES: e / N2'
+    assert isinstance(data, np.ndarray)
+    assert data.dtype == np.float64
+    assert data.shape == (3, 2)
+    assert data[2, 1] == 2.0e-22
+
+    file.write("N2 -> N2(A3)\n 6.17\nCOMMENT: one row\n-----\n 7.0\t1.0e-22\n-----\n")
+    with open(str(file)) as fp:
+        data = parser._read_block(fp)[3]
+    assert data.shape == (1, 2)
+
+
+def test_parse(tmpdir):
+    """Verify parse returns a dict per process with metadata from the header
+    and data as an (n, 2) float64 array"""
+    file = tmpdir.join('lxcat.txt')
+    file.write("some preamble\n\n" + BOLSIG_BLOCK + "\n" + BOLSIG_BLOCK)
+    processes = parser.parse(str(file))
+    assert len(processes) == 2
+    process = processes[0]
+    assert process['kind'] == 'EXCITATION'
+    assert process['target'] == 'N2'
+    assert process['product'] == 'N2(A3)'
+    assert process['threshold'] == 6.17
+    assert process['process'] == 'E + N2 -> E + N2(A3), Excitation'
+    assert process['comment'] == 'fictitious data'
+    assert isinstance(process['data'], np.ndarray)
+    assert process['data'].dtype == np.float64
+    np.testing.assert_array_equal(process['data'],
+                                  [[6.17, 0.0], [7.0, 1.0e-22], [8.0, 2.0e-22]])
+